@@ -0,0 +1,62 @@
+"""Measure how a single shared engine instance scales across threads.
+
+Runs on the standard (GIL) build and on the free-threaded CPython build
+(``python3.13t`` and later); the header shows which one is in use.
+"""
+
+from src.differential.DifferentialTester import REFERENCES
+from src.differential.InputGenerator import InputGenerator
+from concurrent.futures import ThreadPoolExecutor
+import argparse
+import os
+import sys
+import sysconfig
+import time
+
+
+def gil_status():
+    if not sysconfig.get_config_var("Py_GIL_DISABLED"):
+        return "standard build (GIL)"
+    enabled = getattr(sys, "_is_gil_enabled", lambda: True)()
+    return f"free-threaded build, GIL {'enabled' if enabled else 'disabled'}"
+
+
+def run_calls(method, cases, repeat):
+    for _ in range(repeat):
+        for case in cases:
+            method(**case)
+
+
+def measure(method, cases, threads, calls_per_thread):
+    """Return calls per second with ``threads`` threads each making ``calls_per_thread`` calls."""
+    repeat = max(1, calls_per_thread // len(cases))
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        start = time.perf_counter()
+        futures = [pool.submit(run_calls, method, cases, repeat) for _ in range(threads)]
+        for future in futures:
+            future.result()
+        elapsed = time.perf_counter() - start
+    return threads * repeat * len(cases) / elapsed
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark shared engine instances across threads.")
+    parser.add_argument("-t", "--threads", type=int, nargs="+", help="Thread counts to measure.",
+                        default=[1, 2, 4, os.cpu_count() or 8])
+    parser.add_argument("-c", "--calls", type=int, help="Calls per thread.", default=20000)
+    parser.add_argument("-e", "--engine", choices=sorted(REFERENCES), nargs="+", help="Engines to measure.",
+                        default=sorted(REFERENCES))
+    args = parser.parse_args()
+
+    print(f"Python {sys.version.split()[0]}, {gil_status()}, {os.cpu_count()} CPUs")
+    print(f"{'engine':8} {'threads':>7} {'calls/s':>14} {'scaling':>8}")
+    generator = InputGenerator(seed=0)
+    for engine in args.engine:
+        system_class, method_name = REFERENCES[engine]
+        method = getattr(system_class(), method_name)
+        cases = [generator.case(engine, i) for i in range(1000)]
+        baseline = None
+        for threads in sorted(set(args.threads)):
+            throughput = measure(method, cases, threads, args.calls)
+            baseline = baseline or throughput
+            print(f"{engine:8} {threads:7} {throughput:14,.0f} {throughput / baseline:7.2f}x")
@@ -0,0 +1,86 @@
+"""Compare the throughput of the binary wire codecs in ``src/wire`` with JSON."""
+
+from src.energy.EnergyManagementResult import EnergyManagementResult
+from src.flight.BookingResult import BookingResult
+from src.fraud.FraudCheckResult import FraudCheckResult
+from src.fraud.Transaction import Transaction
+from src.wire.Codecs import BOOKING_RESULT, FRAUD_CHECK_RESULT, TRANSACTION, energy_management_result_codec
+from datetime import datetime, timedelta
+import argparse
+import json
+import time
+
+
+DEVICES = ["Security", "Refrigerator", "Heating", "Cooling", "Luzes", "TV"]
+
+
+def transaction_to_json(t):
+    return {"amount": t.amount, "timestamp": t.timestamp.isoformat(), "location": t.location}
+
+
+def transaction_from_json(d):
+    return Transaction(d["amount"], datetime.fromisoformat(d["timestamp"]), d["location"])
+
+
+def build_datasets(n):
+    now = datetime(2024, 10, 1, 12, 0)
+    return {
+        "Transaction": (
+            [Transaction(i * 1.5, now + timedelta(seconds=i), "Brasil") for i in range(n)],
+            TRANSACTION, transaction_to_json, transaction_from_json,
+        ),
+        "FraudCheckResult": (
+            [FraudCheckResult(i % 2 == 0, i % 3 == 0, i % 5 == 0, i % 101) for i in range(n)],
+            FRAUD_CHECK_RESULT, vars, lambda d: FraudCheckResult(**d),
+        ),
+        "BookingResult": (
+            [BookingResult(i % 2 == 0, i * 10.25, i * 0.5, i % 3 == 0) for i in range(n)],
+            BOOKING_RESULT, vars, lambda d: BookingResult(**d),
+        ),
+        "EnergyManagementResult": (
+            [EnergyManagementResult({d: (i + j) % 2 == 0 for j, d in enumerate(DEVICES)}, i % 2 == 0, False, i * 0.5)
+             for i in range(n)],
+            energy_management_result_codec(DEVICES), vars, lambda d: EnergyManagementResult(**d),
+        ),
+    }
+
+
+def best_of(repeat, function):
+    """Return the best wall-clock time of ``repeat`` runs of ``function``."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark binary wire codecs against JSON.")
+    parser.add_argument("-n", "--records", type=int, help="Number of records per batch.", default=100000)
+    parser.add_argument("-r", "--repeat", type=int, help="Number of repetitions (best is reported).", default=5)
+    args = parser.parse_args()
+
+    print(f"{'record':24} {'operation':18} {'json rec/s':>14} {'binary rec/s':>14} {'speedup':>8} {'json B':>10} {'binary B':>10}")
+    for name, (records, codec, to_json, from_json) in build_datasets(args.records).items():
+        json_payload = json.dumps([to_json(r) for r in records]).encode()
+        binary_payload = codec.encode_batch(records)
+        operations = {
+            "encode": (
+                lambda: json.dumps([to_json(r) for r in records]).encode(),
+                lambda: codec.encode_batch(records),
+            ),
+            "decode (objects)": (
+                lambda: [from_json(d) for d in json.loads(json_payload)],
+                lambda: codec.decode_batch(binary_payload),
+            ),
+            "decode (fields)": (
+                lambda: json.loads(json_payload),
+                lambda: list(codec.iter_fields(binary_payload)),
+            ),
+        }
+        for operation, (json_fn, binary_fn) in operations.items():
+            json_time = best_of(args.repeat, json_fn)
+            binary_time = best_of(args.repeat, binary_fn)
+            print(f"{name:24} {operation:18} {args.records / json_time:14,.0f} {args.records / binary_time:14,.0f} "
+                  f"{json_time / binary_time:7.1f}x {len(json_payload):10,} {len(binary_payload):10,}")
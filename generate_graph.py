@@ -1,13 +1,147 @@
 from staticfg import CFGBuilder
+from concurrent.futures import ProcessPoolExecutor
 import argparse
+import ast
+import hashlib
+import json
+import os
+
+
+CACHE_FILE = ".cfg-cache.json"
+
+
+def ast_hash(script):
+    """Hash the AST of a script, so comment and formatting changes do not invalidate the cache."""
+    with open(script, encoding="utf-8") as f:
+        tree = ast.parse(f.read(), filename=script)
+    return hashlib.sha256(ast.dump(tree).encode()).hexdigest()
+
+
+def cfg_to_dict(cfg):
+    """Convert a staticfg CFG (and its function sub-CFGs) into plain JSON-serializable data."""
+    blocks = []
+    visited = set()
+    to_visit = [cfg.entryblock]
+    while to_visit:
+        block = to_visit.pop(0)
+        if block.id in visited:
+            continue
+        visited.add(block.id)
+        blocks.append({
+            "id": block.id,
+            "line": block.at(),
+            "source": block.get_source(),
+            "calls": list(block.func_calls),
+            "exits": [
+                {"target": link.target.id, "exitcase": link.get_exitcase().strip()}
+                for link in block.exits
+            ],
+        })
+        to_visit.extend(link.target for link in block.exits)
+
+    return {
+        "name": cfg.name,
+        "entry": cfg.entryblock.id,
+        "final": [block.id for block in cfg.finalblocks],
+        "blocks": blocks,
+        "functions": {name: cfg_to_dict(sub) for name, sub in cfg.functioncfgs.items()},
+    }
+
+
+def output_path(output_dir, name, fmt):
+    return os.path.join(output_dir, f"{name}.{fmt}")
+
+
+def generate(script, name, output_dir, fmt, show=False):
+    """Build the CFG of ``script`` and write it to ``output_dir`` as a PNG image or as JSON."""
+    cfg = CFGBuilder().build_from_file(name, script)
+    if fmt == "json":
+        with open(output_path(output_dir, name, fmt), "w", encoding="utf-8") as f:
+            json.dump(cfg_to_dict(cfg), f, indent=2)
+    else:
+        cfg.build_visual(os.path.join(output_dir, name), fmt, show=show)
+    return name
+
+
+def collect_scripts(paths):
+    """Expand files and package directories into a sorted list of Python scripts."""
+    scripts = set()
+    for path in paths:
+        if os.path.isdir(path):
+            for root, dirs, files in os.walk(path):
+                dirs[:] = [d for d in dirs if d != "__pycache__"]
+                scripts.update(os.path.join(root, f) for f in files if f.endswith(".py"))
+        else:
+            scripts.add(path)
+    return sorted(scripts)
+
+
+def script_name(script):
+    """Derive an output name from the script path, e.g. src/energy/X.py -> src_energy_X."""
+    relative = os.path.relpath(os.path.splitext(script)[0])
+    return relative.replace(os.sep, "_").lstrip("._")
+
+
+def run_batch(paths, output_dir, fmt, jobs=None, force=False):
+    """
+    Generate the CFG of every script in ``paths`` in parallel worker processes.
+
+    Scripts whose AST hash matches the cached one (and whose output still exists)
+    are skipped. Returns the lists of generated and skipped output names.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    cache_path = os.path.join(output_dir, CACHE_FILE)
+    cache = {}
+    if os.path.exists(cache_path) and not force:
+        with open(cache_path, encoding="utf-8") as f:
+            cache = json.load(f)
+
+    pending = {}
+    skipped = []
+    for script in collect_scripts(paths):
+        name = script_name(script)
+        digest = ast_hash(script)
+        key = f"{name}.{fmt}"
+        if cache.get(key) == digest and os.path.exists(output_path(output_dir, name, fmt)):
+            skipped.append(name)
+        else:
+            pending[name] = (script, key, digest)
+
+    generated = []
+    if pending:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            futures = [
+                pool.submit(generate, script, name, output_dir, fmt)
+                for name, (script, _, _) in pending.items()
+            ]
+            for future in futures:
+                name = future.result()
+                _, key, digest = pending[name]
+                cache[key] = digest
+                generated.append(name)
+
+    with open(cache_path, "w", encoding="utf-8") as f:
+        json.dump(cache, f, indent=2, sort_keys=True)
+    return generated, skipped
 
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Generate a control flow graph (CFG) from a Python script.")
     parser.add_argument("-s", "--script", help="Path to the Python script file.")
     parser.add_argument("-n", "--name", help="Name for the output CFG image file.", default="cfg_output")
+    parser.add_argument("-b", "--batch", nargs="+", metavar="PATH", help="Scripts or package directories to process in batch mode.")
+    parser.add_argument("-f", "--format", help="Output format: an image format for Graphviz (e.g. png) or json.", default="png")
+    parser.add_argument("-o", "--output-dir", help="Directory for the generated files.", default="cfg")
+    parser.add_argument("-j", "--jobs", type=int, help="Number of worker processes in batch mode.", default=None)
+    parser.add_argument("--force", action="store_true", help="Ignore the cache and regenerate every CFG in batch mode.")
     args = parser.parse_args()
 
-    cfg = CFGBuilder().build_from_file(args.name, args.script)
-
-    cfg.build_visual(f"cfg/{args.name}", "png")
+    if args.batch:
+        generated, skipped = run_batch(args.batch, args.output_dir, args.format, args.jobs, args.force)
+        for name in generated:
+            print(f"generated {output_path(args.output_dir, name, args.format)}")
+        print(f"{len(generated)} generated, {len(skipped)} unchanged.")
+    elif args.script:
+        generate(args.script, args.name, args.output_dir, args.format, show=True)
+    else:
+        parser.error("either -s/--script or -b/--batch is required")
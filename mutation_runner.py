@@ -0,0 +1,325 @@
+"""Parallel, cached mutation-testing driver for the engines in ``src``.
+
+Mutants are generated from the modules listed in ``[tool.mutmut] paths_to_mutate``.
+Each mutant only runs the test files that cover its module (taken from the
+coverage contexts recorded by ``pytest --cov-context=test``), mutants are spread
+across a process pool, and mutants whose module source and test files have not
+changed since the previous run are answered from the cache. Any change to a
+file in ``src`` invalidates the cached results, since a mutated module's
+behaviour also depends on the modules it imports.
+"""
+
+import argparse
+import ast
+import copy
+import hashlib
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+try:
+    import tomllib
+except ImportError:  # Python < 3.11
+    import tomli as tomllib
+
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+TESTS_DIR = "tests"
+
+COMPARE_SWAPS = {
+    ast.Lt: ast.LtE, ast.LtE: ast.Lt,
+    ast.Gt: ast.GtE, ast.GtE: ast.Gt,
+    ast.Eq: ast.NotEq, ast.NotEq: ast.Eq,
+    ast.In: ast.NotIn, ast.NotIn: ast.In,
+    ast.Is: ast.IsNot, ast.IsNot: ast.Is,
+}
+BINOP_SWAPS = {
+    ast.Add: ast.Sub, ast.Sub: ast.Add,
+    ast.Mult: ast.Div, ast.Div: ast.Mult,
+}
+BOOLOP_SWAPS = {ast.And: ast.Or, ast.Or: ast.And}
+
+
+def read_paths_to_mutate(pyproject_path):
+    """Return the module paths configured in ``[tool.mutmut]``."""
+    with open(pyproject_path, "rb") as f:
+        config = tomllib.load(f)
+    paths = config.get("tool", {}).get("mutmut", {}).get("paths_to_mutate", "")
+    return [p.strip() for p in paths.split(",") if p.strip()]
+
+
+def sha256_of_files(paths):
+    """Hash the contents of ``paths`` (in sorted order) into a single digest."""
+    digest = hashlib.sha256()
+    for path in sorted(paths):
+        digest.update(path.encode())
+        with open(os.path.join(ROOT, path), "rb") as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+def source_files():
+    """Return every Python file in ``src``, relative to the repository root."""
+    return sorted(
+        os.path.relpath(os.path.join(root, name), ROOT)
+        for root, dirs, files in os.walk(os.path.join(ROOT, "src"))
+        for name in files
+        if name.endswith(".py")
+    )
+
+
+def mutant_path(mutant_id):
+    """Return the module path of a mutant id such as ``src/x.py:3``."""
+    return mutant_id.rsplit(":", 1)[0]
+
+
+def _mutation_sites(tree):
+    """Yield ``(node, field, index, replacement, description)`` for every mutable spot."""
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Compare):
+            for i, op in enumerate(node.ops):
+                swap = COMPARE_SWAPS.get(type(op))
+                if swap:
+                    yield node, "ops", i, swap(), f"{type(op).__name__} -> {swap.__name__}"
+        elif isinstance(node, (ast.BinOp, ast.AugAssign)):
+            swap = BINOP_SWAPS.get(type(node.op))
+            if swap:
+                yield node, "op", None, swap(), f"{type(node.op).__name__} -> {swap.__name__}"
+        elif isinstance(node, ast.BoolOp):
+            swap = BOOLOP_SWAPS.get(type(node.op))
+            if swap:
+                yield node, "op", None, swap(), f"{type(node.op).__name__} -> {swap.__name__}"
+        elif isinstance(node, ast.Constant) and not isinstance(node.value, str):
+            if isinstance(node.value, bool):
+                yield node, "value", None, not node.value, f"{node.value} -> {not node.value}"
+            elif isinstance(node.value, (int, float)):
+                yield node, "value", None, node.value + 1, f"{node.value} -> {node.value + 1}"
+
+
+def generate_mutants(path):
+    """Return the list of mutants for ``path`` as dicts with the mutated source."""
+    with open(os.path.join(ROOT, path), encoding="utf-8") as f:
+        source = f.read()
+    tree = ast.parse(source)
+    site_count = sum(1 for _ in _mutation_sites(tree))
+
+    mutants = []
+    for index in range(site_count):
+        mutated = copy.deepcopy(tree)
+        node, field, position, replacement, description = list(_mutation_sites(mutated))[index]
+        if position is None:
+            setattr(node, field, replacement)
+        else:
+            getattr(node, field)[position] = replacement
+        mutants.append({
+            "id": f"{path}:{index}",
+            "path": path,
+            "line": node.lineno,
+            "description": description,
+            "source": ast.unparse(mutated),
+        })
+    return mutants
+
+
+def all_test_files():
+    """Return every ``test_*.py`` file in the tests directory."""
+    return sorted(
+        os.path.join(TESTS_DIR, name)
+        for name in os.listdir(os.path.join(ROOT, TESTS_DIR))
+        if name.startswith("test_") and name.endswith(".py")
+    )
+
+
+def map_tests_to_modules(paths, coverage_file):
+    """
+    Map each module in ``paths`` to the test files that execute it.
+
+    The mapping is read from the per-test contexts of ``coverage_file``; when
+    the file is missing or older than the modules and tests it describes, it is
+    (re)produced by running the suite once under ``pytest-cov``. Modules without
+    coverage data fall back to every test file.
+    """
+    try:
+        from coverage import CoverageData
+    except ImportError:
+        print("coverage is not installed; running every test file for every mutant.")
+        return {path: all_test_files() for path in paths}
+
+    inputs = [os.path.join(ROOT, p) for p in paths + all_test_files()]
+    if (not os.path.exists(coverage_file)
+            or os.path.getmtime(coverage_file) < max(map(os.path.getmtime, inputs))):
+        subprocess.run(
+            [sys.executable, "-m", "pytest", "-q", "-p", "no:cacheprovider",
+             "--cov=src", "--cov-context=test", "--cov-report=", TESTS_DIR],
+            cwd=ROOT, env={**os.environ, "COVERAGE_FILE": coverage_file}, check=False,
+        )
+
+    data = CoverageData(basename=coverage_file)
+    data.read()
+    measured = {os.path.relpath(f, ROOT): f for f in data.measured_files()}
+
+    mapping = {}
+    for path in paths:
+        tests = set()
+        if path in measured:
+            for contexts in data.contexts_by_lineno(measured[path]).values():
+                for context in contexts:
+                    # Contexts look like "tests/test_x.py::TestX::test_y|run".
+                    test_file = context.split("::", 1)[0]
+                    if test_file.startswith(TESTS_DIR):
+                        tests.add(test_file)
+        mapping[path] = sorted(tests) or all_test_files()
+    return mapping
+
+
+_sandbox = None
+
+
+def _init_worker(workdir):
+    """Give each worker process its own copy of the repository to mutate."""
+    global _sandbox
+    _sandbox = tempfile.mkdtemp(prefix="worker-", dir=workdir)
+    for entry in ("src", TESTS_DIR, "pyproject.toml"):
+        source = os.path.join(ROOT, entry)
+        target = os.path.join(_sandbox, entry)
+        if os.path.isdir(source):
+            shutil.copytree(source, target, ignore=shutil.ignore_patterns("__pycache__"))
+        else:
+            shutil.copy2(source, target)
+
+
+def run_mutant(mutant, test_files, timeout):
+    """Run ``test_files`` against ``mutant`` inside the worker sandbox and return its status."""
+    target = os.path.join(_sandbox, mutant["path"])
+    with open(target, encoding="utf-8") as f:
+        original = f.read()
+    with open(target, "w", encoding="utf-8") as f:
+        f.write(mutant["source"])
+    try:
+        completed = subprocess.run(
+            [sys.executable, "-m", "pytest", "-x", "-q", "-p", "no:cacheprovider",
+             "-p", "no:cov", *test_files],
+            cwd=_sandbox, capture_output=True, timeout=timeout,
+            env={**os.environ, "PYTHONDONTWRITEBYTECODE": "1"},
+        )
+        status = "survived" if completed.returncode == 0 else "killed"
+    except subprocess.TimeoutExpired:
+        status = "timeout"
+    finally:
+        with open(target, "w", encoding="utf-8") as f:
+            f.write(original)
+    return mutant["id"], status
+
+
+def load_cache(cache_path):
+    if not os.path.exists(cache_path):
+        return {}
+    with open(cache_path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_cache(cache_path, cache):
+    with open(cache_path, "w", encoding="utf-8") as f:
+        json.dump(cache, f, indent=2, sort_keys=True)
+
+
+def run(paths, jobs, cache_path, coverage_file, timeout):
+    """
+    Run every mutant of ``paths`` and return ``({mutant_id: status}, cache)``.
+
+    Cached entries of modules outside ``paths`` are kept untouched.
+    """
+    test_map = map_tests_to_modules(paths, coverage_file)
+    cache = load_cache(cache_path)
+    source_hash = sha256_of_files(source_files())
+    results = {}
+    pending = []
+
+    for path in paths:
+        tests_hash = sha256_of_files(test_map[path])
+        for mutant in generate_mutants(path):
+            entry = cache.get(mutant["id"])
+            if (entry and entry["source_hash"] == source_hash
+                    and entry["tests_hash"] == tests_hash
+                    and entry["description"] == mutant["description"]):
+                results[mutant["id"]] = entry["status"]
+                continue
+            mutant["source_hash"] = source_hash
+            mutant["tests_hash"] = tests_hash
+            pending.append(mutant)
+
+    print(f"{len(results)} mutants cached, {len(pending)} to run on {jobs} workers.")
+
+    by_id = {mutant["id"]: mutant for mutant in pending}
+    workdir = tempfile.mkdtemp(prefix="mutation-")
+    try:
+        results.update(_run_pending(pending, test_map, jobs, timeout, workdir))
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    for mutant_id, mutant in by_id.items():
+        cache[mutant_id] = {
+            "description": mutant["description"],
+            "line": mutant["line"],
+            "source_hash": mutant["source_hash"],
+            "tests_hash": mutant["tests_hash"],
+            "status": results[mutant_id],
+        }
+
+    # Drop entries for mutants of the mutated modules that no longer exist.
+    cache = {
+        key: value for key, value in cache.items()
+        if key in results or mutant_path(key) not in paths
+    }
+    save_cache(cache_path, cache)
+    return results, cache
+
+
+def _run_pending(pending, test_map, jobs, timeout, workdir):
+    """Run ``pending`` mutants on a process pool and return ``{mutant_id: status}``."""
+    results = {}
+    if not pending:
+        return results
+    with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker, initargs=(workdir,)) as pool:
+        futures = [
+            pool.submit(run_mutant, mutant, test_map[mutant["path"]], timeout)
+            for mutant in pending
+        ]
+        for future in as_completed(futures):
+            mutant_id, status = future.result()
+            results[mutant_id] = status
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run mutation testing on the src engines in parallel.")
+    parser.add_argument("paths", nargs="*", help="Modules to mutate (defaults to [tool.mutmut] paths_to_mutate).")
+    parser.add_argument("-j", "--jobs", type=int, help="Number of worker processes.", default=os.cpu_count())
+    parser.add_argument("-c", "--cache", help="Path of the mutation cache file.", default=".mutation-cache.json")
+    parser.add_argument("--coverage-file", help="Coverage data file with per-test contexts.", default=".coverage.mutation")
+    parser.add_argument("-t", "--timeout", type=float, help="Timeout in seconds for each mutant.", default=60.0)
+    args = parser.parse_args()
+
+    paths = args.paths or read_paths_to_mutate(os.path.join(ROOT, "pyproject.toml"))
+    results, cache = run(
+        paths,
+        args.jobs,
+        os.path.join(ROOT, args.cache),
+        os.path.join(ROOT, args.coverage_file),
+        args.timeout,
+    )
+
+    by_status = {"killed": [], "survived": [], "timeout": []}
+    for key in sorted(results):
+        by_status[results[key]].append(key)
+    for status in ("timeout", "survived"):
+        for key in by_status[status]:
+            entry = cache[key]
+            print(f"{status.upper():9} {key} (line {entry['line']}): {entry['description']}")
+    print(f"Killed {len(by_status['killed'])}/{len(results)} mutants, "
+          f"{len(by_status['survived'])} survived, {len(by_status['timeout'])} timed out.")
+    sys.exit(1 if by_status["survived"] else 0)
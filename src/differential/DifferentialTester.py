@@ -0,0 +1,180 @@
+import copy
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Optional
+from src.differential.InputGenerator import InputGenerator
+from src.differential.Mismatch import Mismatch
+from src.energy.EnergyManagementSystem import SmartEnergyManagementSystem
+from src.flight.FlightBookingSystem import FlightBookingSystem
+from src.fraud.FraudDetectionSystem import FraudDetectionSystem
+
+
+REFERENCES = {
+    "fraud": (FraudDetectionSystem, "check_for_fraud"),
+    "flight": (FlightBookingSystem, "book_flight"),
+    "energy": (SmartEnergyManagementSystem, "manage_energy"),
+}
+
+
+def reference_implementation(engine: str) -> Callable:
+    """Retorna o método de referência do sistema ``engine``."""
+    system_class, method = REFERENCES[engine]
+    return getattr(system_class(), method)
+
+
+def run_implementation(implementation: Callable, inputs: dict):
+    """
+    Executa a implementação sobre uma cópia das entradas e normaliza o resultado
+    para comparação: os atributos do objeto retornado ou o tipo da exceção lançada.
+    """
+    try:
+        result = implementation(**copy.deepcopy(inputs))
+    except Exception as error:
+        return ("raised", type(error).__name__)
+    return ("returned", type(result).__name__, vars(result))
+
+
+def same_outcome(expected, actual) -> bool:
+    """Compara dois resultados, tolerando diferenças de arredondamento em floats."""
+    if isinstance(expected, float) or isinstance(actual, float):
+        if isinstance(expected, bool) or isinstance(actual, bool):
+            return expected is actual
+        if not isinstance(expected, (int, float)) or not isinstance(actual, (int, float)):
+            return False
+        return math.isclose(expected, actual, rel_tol=1e-9, abs_tol=1e-9)
+    if isinstance(expected, dict) and isinstance(actual, dict):
+        return expected.keys() == actual.keys() and all(
+            same_outcome(expected[key], actual[key]) for key in expected
+        )
+    if isinstance(expected, (list, tuple)) and isinstance(actual, (list, tuple)):
+        return type(expected) is type(actual) and len(expected) == len(actual) and all(
+            same_outcome(e, a) for e, a in zip(expected, actual)
+        )
+    return type(expected) is type(actual) and expected == actual
+
+
+def _failing_cases(engine: str, implementation: Callable, seed: int, start: int, stop: int) -> list[int]:
+    """Retorna os índices, no intervalo [start, stop), dos casos em que as implementações divergem."""
+    generator = InputGenerator(seed)
+    reference = reference_implementation(engine)
+    failing = []
+    for index in range(start, stop):
+        inputs = generator.case(engine, index)
+        if not same_outcome(run_implementation(reference, inputs), run_implementation(implementation, inputs)):
+            failing.append(index)
+    return failing
+
+
+def _simpler_values(value):
+    """Gera versões mais simples de ``value``, usadas para reduzir um caso divergente."""
+    if isinstance(value, bool):
+        if value:
+            yield False
+    elif isinstance(value, int):
+        if value != 0:
+            yield 0
+            if value // 2 != value:
+                yield value // 2
+            yield value - 1 if value > 0 else value + 1
+    elif isinstance(value, float):
+        if value != 0:
+            yield 0.0
+            if float(round(value)) != value:
+                yield float(round(value))
+            else:
+                for simpler in _simpler_values(int(value)):
+                    yield float(simpler)
+    elif isinstance(value, (list, tuple)):
+        for i in range(len(value)):
+            if isinstance(value, list):
+                yield value[:i] + value[i + 1:]
+        for i, item in enumerate(value):
+            for simpler in _simpler_values(item):
+                yield type(value)([*value[:i], simpler, *value[i + 1:]])
+    elif isinstance(value, dict):
+        for key in value:
+            yield {k: v for k, v in value.items() if k != key}
+        for key, item in value.items():
+            for simpler in _simpler_values(item):
+                yield {**value, key: simpler}
+    elif hasattr(value, "__dict__"):
+        for attribute, item in vars(value).items():
+            for simpler in _simpler_values(item):
+                candidate = copy.copy(value)
+                setattr(candidate, attribute, simpler)
+                yield candidate
+
+
+class DifferentialTester:
+    """
+    Compara implementações rápidas registradas com as implementações de referência
+    de ``check_for_fraud``, ``book_flight`` e ``manage_energy``.
+
+    Os casos são gerados por ``InputGenerator`` e distribuídos em lotes entre
+    processos. Para cada implementação divergente, o primeiro caso com divergência
+    é reduzido a um reprodutor mínimo. As implementações registradas precisam ser
+    serializáveis com ``pickle`` (por exemplo, funções definidas no nível do módulo)
+    quando ``workers`` for maior que 1.
+    """
+    def __init__(self, seed: int = 0, workers: Optional[int] = None, chunk_size: int = 500, max_shrinks: int = 1000):
+        self.seed = seed
+        self.workers = workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        self.max_shrinks = max_shrinks
+        self.generator = InputGenerator(seed)
+        self.implementations: dict[str, dict[str, Callable]] = {engine: {} for engine in REFERENCES}
+
+    def register(self, engine: str, name: str, implementation: Callable) -> None:
+        """Registra uma implementação rápida, chamada com os mesmos argumentos nomeados da referência."""
+        if engine not in REFERENCES:
+            raise ValueError(f"Unknown engine '{engine}', expected one of {sorted(REFERENCES)}")
+        self.implementations[engine][name] = implementation
+
+    def run(self, engine: str, cases: int = 10000) -> list[Mismatch]:
+        """
+        Executa ``cases`` casos contra cada implementação registrada para ``engine``
+        e retorna uma divergência reduzida por implementação que falhou.
+        """
+        mismatches = []
+        for name, implementation in self.implementations[engine].items():
+            failing = self._find_failing(engine, implementation, cases)
+            if failing:
+                mismatches.append(self.shrink(engine, name, implementation, min(failing)))
+        return mismatches
+
+    def _find_failing(self, engine: str, implementation: Callable, cases: int) -> list[int]:
+        chunks = [(start, min(start + self.chunk_size, cases)) for start in range(0, cases, self.chunk_size)]
+        if self.workers == 1:
+            return [i for start, stop in chunks for i in _failing_cases(engine, implementation, self.seed, start, stop)]
+        with ProcessPoolExecutor(max_workers=self.workers) as pool:
+            futures = [
+                pool.submit(_failing_cases, engine, implementation, self.seed, start, stop)
+                for start, stop in chunks
+            ]
+            return [i for future in futures for i in future.result()]
+
+    def shrink(self, engine: str, name: str, implementation: Callable, case_index: int) -> Mismatch:
+        """Reduz o caso ``case_index`` enquanto a divergência se mantiver."""
+        reference = reference_implementation(engine)
+
+        def diverges(inputs: dict) -> bool:
+            return not same_outcome(run_implementation(reference, inputs), run_implementation(implementation, inputs))
+
+        inputs = self.generator.case(engine, case_index)
+        for _ in range(self.max_shrinks):
+            for key, value in inputs.items():
+                candidate = next(
+                    (c for c in ({**inputs, key: s} for s in _simpler_values(value)) if diverges(c)),
+                    None,
+                )
+                if candidate is not None:
+                    inputs = candidate
+                    break
+            else:
+                break
+
+        return Mismatch(
+            engine, name, case_index, inputs,
+            run_implementation(reference, inputs), run_implementation(implementation, inputs),
+        )
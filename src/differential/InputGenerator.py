@@ -0,0 +1,97 @@
+import random
+from datetime import datetime, timedelta
+from src.fraud.Transaction import Transaction
+from src.energy.DeviceSchedule import DeviceSchedule
+
+
+BASE_TIME = datetime(2024, 10, 1, 12, 0, 0)
+LOCATIONS = ["Brasil", "EUA", "Chile", "Japão"]
+DEVICES = ["Security", "Refrigerator", "Heating", "Cooling", "Luzes", "TV", "Forno"]
+
+
+class InputGenerator:
+    """
+    Gera entradas aleatórias para os três sistemas, privilegiando os valores de
+    fronteira de cada regra (10000, 30 e 60 minutos, 24h e 48h, prioridade 1 e 2, ...).
+
+    Cada caso é um dicionário com os argumentos nomeados do método de referência
+    e é determinado apenas pela semente, de modo que um caso pode ser refeito a
+    partir do seu índice em qualquer processo.
+    """
+    def __init__(self, seed: int = 0):
+        self.seed = seed
+
+    def case(self, engine: str, index: int) -> dict:
+        """Retorna o caso de número ``index`` para o sistema ``engine``."""
+        rng = random.Random(f"{self.seed}:{engine}:{index}")
+        return getattr(self, f"_{engine}_case")(rng)
+
+    @staticmethod
+    def _pick(rng: random.Random, boundaries: list, low: float, high: float) -> float:
+        """Escolhe um valor de fronteira em metade das vezes e um valor uniforme no restante."""
+        if rng.random() < 0.5:
+            return rng.choice(boundaries)
+        return rng.uniform(low, high)
+
+    def _fraud_case(self, rng: random.Random) -> dict:
+        now = BASE_TIME + timedelta(minutes=rng.randint(0, 60 * 24 * 30))
+        previous_transactions = []
+        for _ in range(rng.choice([0, 1, 2, 10, 11, 12, rng.randint(0, 20)])):
+            minutes = self._pick(rng, [0, 29.99, 30, 30.01, 59.99, 60, 60.01, 600], -10, 180)
+            previous_transactions.append(Transaction(
+                amount=round(rng.uniform(0, 20000), 2),
+                timestamp=now - timedelta(minutes=minutes),
+                location=rng.choice(LOCATIONS),
+            ))
+        return {
+            "current_transaction": Transaction(
+                amount=self._pick(rng, [0, 9999.99, 10000, 10000.01], 0, 20000),
+                timestamp=now,
+                location=rng.choice(LOCATIONS),
+            ),
+            "previous_transactions": previous_transactions,
+            "blacklisted_locations": rng.sample(LOCATIONS, rng.randint(0, 2)),
+        }
+
+    def _flight_case(self, rng: random.Random) -> dict:
+        booking_time = BASE_TIME + timedelta(minutes=rng.randint(0, 60 * 24 * 30))
+        hours = self._pick(rng, [0, 23.99, 24, 24.01, 47.99, 48, 48.01], -12, 200)
+        return {
+            "passengers": rng.choice([0, 1, 4, 5, rng.randint(1, 300)]),
+            "booking_time": booking_time,
+            "available_seats": rng.choice([0, 4, 5, rng.randint(0, 300)]),
+            "current_price": self._pick(rng, [0.0, 100.0, 1000.0], 0, 5000),
+            "previous_sales": rng.choice([0, 100, rng.randint(0, 1000)]),
+            "is_cancellation": rng.random() < 0.5,
+            "departure_time": booking_time + timedelta(hours=hours),
+            "reward_points_available": rng.choice([0, 1, rng.randint(0, 1000000)]),
+        }
+
+    def _energy_case(self, rng: random.Random) -> dict:
+        current_time = BASE_TIME.replace(
+            hour=rng.choice([5, 6, 22, 23, rng.randint(0, 23)]),
+            minute=rng.choice([0, 59, rng.randint(0, 59)]),
+        )
+        low = round(rng.uniform(15, 22), 1)
+        high = round(low + rng.uniform(0, 6), 1)
+        devices = rng.sample(DEVICES, rng.randint(0, len(DEVICES)))
+        price_threshold = round(rng.uniform(0.05, 0.5), 2)
+        energy_usage_limit = rng.randint(0, 50)
+        scheduled_devices = [
+            DeviceSchedule(
+                device_name=rng.choice(DEVICES),
+                scheduled_time=rng.choice([current_time, current_time + timedelta(minutes=1)]),
+            )
+            for _ in range(rng.randint(0, 3))
+        ]
+        return {
+            "current_price": rng.choice([price_threshold, round(price_threshold + 0.01, 2), round(rng.uniform(0, 0.6), 2)]),
+            "price_threshold": price_threshold,
+            "device_priorities": {device: rng.choice([1, 2, 3]) for device in devices},
+            "current_time": current_time,
+            "current_temperature": rng.choice([low, high, low - 0.1, high + 0.1, round(rng.uniform(10, 30), 1)]),
+            "desired_temperature_range": (low, high),
+            "energy_usage_limit": energy_usage_limit,
+            "total_energy_used_today": rng.choice([energy_usage_limit, energy_usage_limit - 1, energy_usage_limit + rng.randint(1, 10), rng.randint(0, 60)]),
+            "scheduled_devices": scheduled_devices,
+        }
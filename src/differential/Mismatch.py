@@ -0,0 +1,18 @@
+class Mismatch:
+    """Armazena uma divergência entre a implementação de referência e uma implementação rápida."""
+    def __init__(self, engine: str, implementation: str, case_index: int, inputs: dict, expected, actual):
+        self.engine = engine
+        self.implementation = implementation
+        self.case_index = case_index
+        self.inputs = inputs
+        self.expected = expected
+        self.actual = actual
+
+    def __repr__(self) -> str:
+        """Retorna uma representação legível do objeto."""
+        return (f"Mismatch(engine='{self.engine}', "
+                f"implementation='{self.implementation}', "
+                f"case_index={self.case_index}, "
+                f"inputs={self.inputs}, "
+                f"expected={self.expected}, "
+                f"actual={self.actual})")
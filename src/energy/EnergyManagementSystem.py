@@ -3,7 +3,13 @@ from src.energy.DeviceSchedule import DeviceSchedule
 from src.energy.EnergyManagementResult import EnergyManagementResult
 
 class SmartEnergyManagementSystem:
-    """Um sistema para gerenciar inteligentemente o consumo de energia."""
+    """
+    Um sistema para gerenciar inteligentemente o consumo de energia.
+
+    Sem estado por instância; ``manage_energy`` monta ``device_status`` em um
+    dicionário local a cada chamada, então a instância pode ser compartilhada entre threads.
+    """
+    __slots__ = ()
     def manage_energy(
         self,
         current_price: float,
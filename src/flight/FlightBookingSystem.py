@@ -4,7 +4,10 @@ from src.flight.BookingResult import BookingResult
 class FlightBookingSystem:
     """
     Um sistema para gerenciar a reserva e o cancelamento de voos.
+
+    Sem estado por instância, segura para uso compartilhado entre threads.
     """
+    __slots__ = ()
     def book_flight(
                     self, 
                     passengers: int, 
@@ -3,7 +3,13 @@ from src.fraud.FraudCheckResult import FraudCheckResult
 
 
 class FraudDetectionSystem:
-    """Um sistema para detectar transações potencialmente fraudulentas."""
+    """
+    Um sistema para detectar transações potencialmente fraudulentas.
+
+    Não guarda estado: uma única instância pode ser usada por várias threads
+    ao mesmo tempo (veja a seção de concorrência do README).
+    """
+    __slots__ = ()
     def check_for_fraud(
         self,
         current_transaction: Transaction,
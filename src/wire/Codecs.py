@@ -0,0 +1,95 @@
+from src.energy.EnergyManagementResult import EnergyManagementResult
+from src.flight.BookingResult import BookingResult
+from src.fraud.FraudCheckResult import FraudCheckResult
+from src.fraud.Transaction import Transaction
+from src.wire.RecordCodec import (
+    RecordCodec,
+    datetime_to_micros,
+    micros_to_datetime,
+    pack_text,
+    unpack_text,
+)
+
+
+LOCATION_SIZE = 32
+MAX_DEVICES = 32
+
+# Todos os layouts são little-endian e sem alinhamento implícito ("<").
+
+# amount (float64), timestamp (int64, µs desde a época), location (UTF-8, 32 bytes)
+TRANSACTION = RecordCodec(
+    f"<dq{LOCATION_SIZE}s",
+    lambda t: (t.amount, datetime_to_micros(t.timestamp), pack_text(t.location, LOCATION_SIZE)),
+    lambda f: Transaction(f[0], micros_to_datetime(f[1]), unpack_text(f[2])),
+)
+
+# is_fraudulent, is_blocked, verification_required (bool), risk_score (int32)
+FRAUD_CHECK_RESULT = RecordCodec(
+    "<???xi",
+    lambda r: (r.is_fraudulent, r.is_blocked, r.verification_required, r.risk_score),
+    lambda f: FraudCheckResult(f[0], f[1], f[2], f[3]),
+)
+
+# Argumentos nomeados de FlightBookingSystem.book_flight:
+# booking_time, departure_time (int64, µs), current_price (float64), reward_points_available (int64),
+# passengers, available_seats, previous_sales (int32), is_cancellation (bool)
+BOOKING_REQUEST = RecordCodec(
+    "<qqdqiii?",
+    lambda r: (
+        datetime_to_micros(r["booking_time"]), datetime_to_micros(r["departure_time"]),
+        r["current_price"], r["reward_points_available"],
+        r["passengers"], r["available_seats"], r["previous_sales"], r["is_cancellation"],
+    ),
+    lambda f: {
+        "passengers": f[4],
+        "booking_time": micros_to_datetime(f[0]),
+        "available_seats": f[5],
+        "current_price": f[2],
+        "previous_sales": f[6],
+        "is_cancellation": f[7],
+        "departure_time": micros_to_datetime(f[1]),
+        "reward_points_available": f[3],
+    },
+)
+
+# total_price, refund_amount (float64), confirmation, points_used (bool)
+BOOKING_RESULT = RecordCodec(
+    "<dd??",
+    lambda r: (r.total_price, r.refund_amount, r.confirmation, r.points_used),
+    lambda f: BookingResult(f[2], f[0], f[1], f[3]),
+)
+
+
+def energy_management_result_codec(device_names: list[str]) -> RecordCodec:
+    """
+    Cria o codec de ``EnergyManagementResult`` para uma tabela fixa de dispositivos.
+
+    ``device_status`` é gravado como duas máscaras de 32 bits: os dispositivos
+    presentes e os ligados, com o bit ``i`` correspondendo a ``device_names[i]``.
+    Na decodificação, as chaves seguem a ordem da tabela.
+    """
+    if len(device_names) > MAX_DEVICES:
+        raise ValueError(f"At most {MAX_DEVICES} devices are supported, got {len(device_names)}")
+    bits = {name: 1 << i for i, name in enumerate(device_names)}
+
+    def to_fields(result: EnergyManagementResult) -> tuple:
+        present = on = 0
+        for device, status in result.device_status.items():
+            if device not in bits:
+                raise ValueError(f"Device '{device}' is not in the codec device table")
+            present |= bits[device]
+            if status:
+                on |= bits[device]
+        return (present, on, result.energy_saving_mode,
+                result.temperature_regulation_active, result.total_energy_used)
+
+    def from_fields(fields: tuple) -> EnergyManagementResult:
+        present, on = fields[0], fields[1]
+        device_status = {
+            name: bool(on & bit) for name, bit in bits.items() if present & bit
+        }
+        return EnergyManagementResult(device_status, fields[2], fields[3], fields[4])
+
+    # present, on (uint32), energy_saving_mode, temperature_regulation_active (bool),
+    # total_energy_used (float64)
+    return RecordCodec("<II??d", to_fields, from_fields)
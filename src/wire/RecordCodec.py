@@ -0,0 +1,84 @@
+import struct
+from datetime import datetime, timedelta
+from typing import Callable, Iterable, Iterator
+
+
+EPOCH = datetime(1970, 1, 1)
+MICROSECOND = timedelta(microseconds=1)
+
+
+def datetime_to_micros(value: datetime) -> int:
+    """Converte um datetime ingênuo (sem fuso) em microssegundos desde a época."""
+    return (value - EPOCH) // MICROSECOND
+
+
+def micros_to_datetime(value: int) -> datetime:
+    """Converte microssegundos desde a época de volta em um datetime ingênuo."""
+    return EPOCH + timedelta(0, 0, value)
+
+
+def pack_text(value: str, size: int) -> bytes:
+    """Codifica um texto em UTF-8 num campo de tamanho fixo, completado com bytes nulos."""
+    data = value.encode("utf-8")
+    if len(data) > size or b"\0" in data:
+        raise ValueError(f"Text {value!r} does not fit in a {size}-byte field")
+    return data
+
+
+def unpack_text(value: bytes) -> str:
+    """Decodifica um campo de texto de tamanho fixo."""
+    return value.rstrip(b"\0").decode("utf-8")
+
+
+class RecordCodec:
+    """
+    Codifica registros com um layout binário fixo descrito por um formato de ``struct``.
+
+    ``to_fields`` converte um objeto na tupla de campos do layout e ``from_fields``
+    faz o caminho inverso. Um lote é apenas a concatenação dos registros, de modo
+    que ``iter_fields`` percorre um buffer (``bytes``, ``bytearray`` ou
+    ``memoryview``) sem copiá-lo e sem criar os objetos de domínio.
+    """
+    def __init__(self, fmt: str, to_fields: Callable, from_fields: Callable):
+        self.struct = struct.Struct(fmt)
+        self.size = self.struct.size
+        self.to_fields = to_fields
+        self.from_fields = from_fields
+
+    def encode(self, record) -> bytes:
+        """Codifica um único registro."""
+        return self.struct.pack(*self.to_fields(record))
+
+    def encode_into(self, buffer, offset: int, record) -> None:
+        """Escreve um registro em ``buffer`` a partir de ``offset``."""
+        self.struct.pack_into(buffer, offset, *self.to_fields(record))
+
+    def encode_batch(self, records: Iterable) -> bytearray:
+        """Codifica uma sequência de registros num único buffer pré-alocado."""
+        records = list(records)
+        buffer = bytearray(self.size * len(records))
+        pack_into, to_fields, size = self.struct.pack_into, self.to_fields, self.size
+        for i, record in enumerate(records):
+            pack_into(buffer, i * size, *to_fields(record))
+        return buffer
+
+    def count(self, buffer) -> int:
+        """Retorna o número de registros em ``buffer``."""
+        length = memoryview(buffer).nbytes
+        if length % self.size:
+            raise ValueError(f"Buffer of {length} bytes is not a multiple of the {self.size}-byte record size")
+        return length // self.size
+
+    def iter_fields(self, buffer) -> Iterator[tuple]:
+        """Percorre os campos brutos de cada registro de ``buffer`` sem copiá-lo."""
+        self.count(buffer)
+        return self.struct.iter_unpack(memoryview(buffer))
+
+    def decode(self, buffer, offset: int = 0):
+        """Decodifica o registro que começa em ``offset``."""
+        return self.from_fields(self.struct.unpack_from(buffer, offset))
+
+    def decode_batch(self, buffer) -> list:
+        """Decodifica todos os registros de ``buffer``."""
+        from_fields = self.from_fields
+        return [from_fields(fields) for fields in self.iter_fields(buffer)]
@@ -0,0 +1,36 @@
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from src.differential.DifferentialTester import run_implementation, same_outcome
+from src.differential.InputGenerator import InputGenerator
+from src.energy.EnergyManagementSystem import SmartEnergyManagementSystem
+from src.flight.FlightBookingSystem import FlightBookingSystem
+from src.fraud.FraudDetectionSystem import FraudDetectionSystem
+
+
+ENGINES = [
+    ("fraud", FraudDetectionSystem, "check_for_fraud"),
+    ("flight", FlightBookingSystem, "book_flight"),
+    ("energy", SmartEnergyManagementSystem, "manage_energy"),
+]
+
+
+class TestConcurrency:
+
+    @pytest.mark.parametrize("engine, system_class, method", ENGINES)
+    def test_shared_instance_matches_serial_results(self, engine, system_class, method):
+        """A single instance shared by a thread pool returns the same results as serial calls."""
+        generator = InputGenerator(seed=3)
+        cases = [generator.case(engine, i) for i in range(400)]
+        implementation = getattr(system_class(), method)
+
+        serial = [run_implementation(implementation, case) for case in cases]
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            threaded = list(pool.map(lambda case: run_implementation(implementation, case), cases))
+
+        assert all(same_outcome(s, t) for s, t in zip(serial, threaded))
+
+    @pytest.mark.parametrize("engine, system_class, method", ENGINES)
+    def test_engine_has_no_instance_state(self, engine, system_class, method):
+        """Engines cannot hold per-instance state that would be shared between threads."""
+        with pytest.raises(AttributeError):
+            system_class().cache = {}
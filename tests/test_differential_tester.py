@@ -0,0 +1,85 @@
+import pytest
+from datetime import timedelta
+from src.differential.DifferentialTester import DifferentialTester, reference_implementation
+from src.differential.InputGenerator import InputGenerator
+from src.flight.BookingResult import BookingResult
+from src.flight.FlightBookingSystem import FlightBookingSystem
+from src.fraud.FraudDetectionSystem import FraudDetectionSystem
+
+
+def same_as_reference_fraud(**kwargs):
+    return FraudDetectionSystem().check_for_fraud(**kwargs)
+
+
+def same_as_reference_flight(**kwargs):
+    return FlightBookingSystem().book_flight(**kwargs)
+
+
+def wrong_group_discount(**kwargs):
+    """Aplica o desconto de grupo a partir de 4 passageiros, em vez de acima de 4."""
+    result = FlightBookingSystem().book_flight(**kwargs)
+    if kwargs["passengers"] == 4 and result.confirmation:
+        return BookingResult(True, result.total_price * 0.95, result.refund_amount, result.points_used)
+    return result
+
+
+class TestDifferentialTester:
+
+    def test_generator_is_deterministic(self):
+        """The same seed and index always produce the same case."""
+        first = InputGenerator(seed=7).case("flight", 3)
+        second = InputGenerator(seed=7).case("flight", 3)
+        assert first == second
+
+    def test_generator_covers_boundaries(self):
+        """The corpus includes the boundaries of 60 minutes, 24h/48h and priorities 1 and 2."""
+        generator = InputGenerator(seed=0)
+        fraud = [generator.case("fraud", i) for i in range(300)]
+        flight = [generator.case("flight", i) for i in range(300)]
+        energy = [generator.case("energy", i) for i in range(300)]
+
+        assert any(
+            c["current_transaction"].timestamp - t.timestamp == timedelta(minutes=60)
+            for c in fraud for t in c["previous_transactions"]
+        )
+        hours = {c["departure_time"] - c["booking_time"] for c in flight}
+        assert timedelta(hours=24) in hours
+        assert timedelta(hours=48) in hours
+        priorities = {p for c in energy for p in c["device_priorities"].values()}
+        assert {1, 2} <= priorities
+
+    def test_equivalent_implementation_has_no_mismatch(self):
+        """An implementation equal to the reference produces no mismatches."""
+        tester = DifferentialTester(seed=1, workers=2, chunk_size=100)
+        tester.register("fraud", "same", same_as_reference_fraud)
+        tester.register("flight", "same", same_as_reference_flight)
+
+        assert tester.run("fraud", cases=400) == []
+        assert tester.run("flight", cases=400) == []
+
+    def test_mismatch_is_found_and_shrunk(self):
+        """A boundary bug is found and shrunk to a minimal reproducer."""
+        tester = DifferentialTester(seed=1, workers=1)
+        tester.register("flight", "wrong_group_discount", wrong_group_discount)
+
+        mismatches = tester.run("flight", cases=500)
+
+        assert len(mismatches) == 1
+        mismatch = mismatches[0]
+        assert mismatch.implementation == "wrong_group_discount"
+        assert mismatch.inputs["passengers"] == 4
+        assert mismatch.inputs["is_cancellation"] is False
+        assert mismatch.inputs["reward_points_available"] == 0
+        assert mismatch.expected != mismatch.actual
+
+    def test_reference_results_are_unchanged(self):
+        """The reference implementation of each engine returns its own result type."""
+        inputs = InputGenerator(seed=0).case("energy", 0)
+        result = reference_implementation("energy")(**inputs)
+        assert type(result).__name__ == "EnergyManagementResult"
+
+    def test_unknown_engine_is_rejected(self):
+        """Registering an implementation for an unknown engine raises ValueError."""
+        tester = DifferentialTester()
+        with pytest.raises(ValueError):
+            tester.register("hotel", "fast", same_as_reference_flight)
@@ -0,0 +1,104 @@
+import sys
+import pytest
+import mutation_runner
+
+
+FRAUD = "src/fraud/FraudDetectionSystem.py"
+FLIGHT = "src/flight/FlightBookingSystem.py"
+
+
+class TestMutationRunner:
+
+    def setup_method(self):
+        self.executed = []
+
+    def fake_run_pending(self, pending, test_map, jobs, timeout, workdir):
+        """Replaces the process pool: records the mutants and marks them all as killed."""
+        self.executed.extend(mutant["id"] for mutant in pending)
+        return {mutant["id"]: "killed" for mutant in pending}
+
+    def run(self, monkeypatch, paths, cache_path):
+        monkeypatch.setattr(mutation_runner, "_run_pending", self.fake_run_pending)
+        monkeypatch.setattr(
+            mutation_runner, "map_tests_to_modules",
+            lambda paths, coverage_file: {path: mutation_runner.all_test_files() for path in paths},
+        )
+        self.executed = []
+        return mutation_runner.run(paths, 1, str(cache_path), "unused", 1.0)
+
+    def test_generate_mutants(self):
+        """Each mutant changes the source and has a stable, unique id."""
+        mutants = mutation_runner.generate_mutants(FLIGHT)
+        original = open(mutation_runner.ROOT + "/" + FLIGHT, encoding="utf-8").read()
+
+        assert mutants
+        assert len({m["id"] for m in mutants}) == len(mutants)
+        assert all(m["id"].startswith(FLIGHT + ":") for m in mutants)
+        assert any(m["description"] == "Lt -> LtE" for m in mutants)
+        assert all(m["source"] != original for m in mutants)
+        assert [m["id"] for m in mutation_runner.generate_mutants(FLIGHT)] == [m["id"] for m in mutants]
+
+    def test_map_tests_without_coverage_uses_all_tests(self, monkeypatch):
+        """Without the coverage package every module maps to every test file."""
+        monkeypatch.setitem(sys.modules, "coverage", None)
+
+        mapping = mutation_runner.map_tests_to_modules([FRAUD, FLIGHT], "unused")
+
+        assert mapping == {FRAUD: mutation_runner.all_test_files(), FLIGHT: mutation_runner.all_test_files()}
+
+    def test_map_tests_without_module_data_uses_all_tests(self, tmp_path):
+        """A module missing from the coverage data maps to every test file."""
+        coverage = pytest.importorskip("coverage")
+        coverage_file = str(tmp_path / ".coverage")
+        data = coverage.CoverageData(basename=coverage_file)
+        data.add_lines({str(tmp_path / "other.py"): [1]})
+        data.write()
+
+        mapping = mutation_runner.map_tests_to_modules([FRAUD], coverage_file)
+
+        assert mapping == {FRAUD: mutation_runner.all_test_files()}
+
+    def test_cache_is_reused(self, monkeypatch, tmp_path):
+        """A second run with unchanged sources and tests runs no mutant."""
+        cache_path = tmp_path / "cache.json"
+
+        first, _ = self.run(monkeypatch, [FLIGHT], cache_path)
+        assert sorted(self.executed) == sorted(first)
+
+        second, _ = self.run(monkeypatch, [FLIGHT], cache_path)
+        assert self.executed == []
+        assert second == first
+
+    def test_partial_run_keeps_other_modules(self, monkeypatch, tmp_path):
+        """Running a single module keeps the cached results of the others."""
+        cache_path = tmp_path / "cache.json"
+        self.run(monkeypatch, [FRAUD, FLIGHT], cache_path)
+
+        self.run(monkeypatch, [FRAUD], cache_path)
+        self.run(monkeypatch, [FRAUD, FLIGHT], cache_path)
+
+        assert self.executed == []
+
+    def test_stale_mutants_are_pruned(self, monkeypatch, tmp_path):
+        """Entries of mutated modules that are no longer generated are dropped."""
+        cache_path = tmp_path / "cache.json"
+        self.run(monkeypatch, [FRAUD, FLIGHT], cache_path)
+        cache = mutation_runner.load_cache(str(cache_path))
+        cache[FRAUD + ":9999"] = dict(cache[FRAUD + ":0"])
+        cache[FLIGHT + ":9999"] = dict(cache[FLIGHT + ":0"])
+        mutation_runner.save_cache(str(cache_path), cache)
+
+        _, cache = self.run(monkeypatch, [FRAUD], cache_path)
+
+        assert FRAUD + ":9999" not in cache
+        assert FLIGHT + ":9999" in cache
+
+    def test_source_change_invalidates_cache(self, monkeypatch, tmp_path):
+        """A change in any file of src (e.g. an imported module) reruns the mutants."""
+        cache_path = tmp_path / "cache.json"
+        self.run(monkeypatch, [FLIGHT], cache_path)
+        monkeypatch.setattr(mutation_runner, "source_files", lambda: [FLIGHT, FRAUD][::-1] + ["src/__init__.py"])
+
+        results, _ = self.run(monkeypatch, [FLIGHT], cache_path)
+
+        assert sorted(self.executed) == sorted(results)
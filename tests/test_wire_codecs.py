@@ -0,0 +1,86 @@
+import pytest
+from datetime import datetime
+from src.energy.EnergyManagementResult import EnergyManagementResult
+from src.flight.BookingResult import BookingResult
+from src.fraud.FraudCheckResult import FraudCheckResult
+from src.fraud.Transaction import Transaction
+from src.wire.Codecs import (
+    BOOKING_REQUEST,
+    BOOKING_RESULT,
+    FRAUD_CHECK_RESULT,
+    TRANSACTION,
+    energy_management_result_codec,
+)
+
+
+class TestWireCodecs:
+
+    def setup_method(self):
+        self.now = datetime(2024, 10, 1, 12, 30, 15, 123456)
+
+    def test_transaction_roundtrip(self):
+        """Transactions keep amount, timestamp (to the microsecond) and location."""
+        transaction = Transaction(15000.5, self.now, "São Paulo")
+
+        decoded = TRANSACTION.decode(TRANSACTION.encode(transaction))
+
+        assert vars(decoded) == vars(transaction)
+
+    def test_fraud_check_result_roundtrip(self):
+        result = FraudCheckResult(True, False, True, 70)
+
+        decoded = FRAUD_CHECK_RESULT.decode(FRAUD_CHECK_RESULT.encode(result))
+
+        assert vars(decoded) == vars(result)
+
+    def test_booking_request_and_result_roundtrip(self):
+        request = {
+            "passengers": 5,
+            "booking_time": self.now,
+            "available_seats": 10,
+            "current_price": 250.0,
+            "previous_sales": 80,
+            "is_cancellation": False,
+            "departure_time": datetime(2024, 10, 3, 12, 30),
+            "reward_points_available": 1000,
+        }
+        result = BookingResult(True, 1234.56, 0.0, True)
+
+        assert BOOKING_REQUEST.decode(BOOKING_REQUEST.encode(request)) == request
+        assert vars(BOOKING_RESULT.decode(BOOKING_RESULT.encode(result))) == vars(result)
+
+    def test_energy_management_result_roundtrip(self):
+        codec = energy_management_result_codec(["Security", "Heating", "Cooling", "TV"])
+        result = EnergyManagementResult({"TV": False, "Security": True, "Heating": True}, True, True, 41.5)
+
+        decoded = codec.decode(codec.encode(result))
+
+        assert decoded.device_status == {"Security": True, "Heating": True, "TV": False}
+        assert decoded.energy_saving_mode is True
+        assert decoded.temperature_regulation_active is True
+        assert decoded.total_energy_used == 41.5
+
+    def test_energy_management_result_unknown_device(self):
+        codec = energy_management_result_codec(["Security"])
+        with pytest.raises(ValueError):
+            codec.encode(EnergyManagementResult({"TV": True}, False, False, 0.0))
+
+    def test_batch_encode_and_iterate_fields(self):
+        """A batch is a flat buffer whose raw fields can be read without building objects."""
+        results = [FraudCheckResult(i % 2 == 0, False, False, i) for i in range(1000)]
+
+        buffer = FRAUD_CHECK_RESULT.encode_batch(results)
+
+        assert len(buffer) == 1000 * FRAUD_CHECK_RESULT.size
+        assert FRAUD_CHECK_RESULT.count(buffer) == 1000
+        assert [fields[3] for fields in FRAUD_CHECK_RESULT.iter_fields(memoryview(buffer))] == list(range(1000))
+        assert [vars(r) for r in FRAUD_CHECK_RESULT.decode_batch(buffer)] == [vars(r) for r in results]
+
+    def test_truncated_buffer_is_rejected(self):
+        buffer = TRANSACTION.encode_batch([Transaction(1.0, self.now, "Brasil")] * 2)
+        with pytest.raises(ValueError):
+            TRANSACTION.decode_batch(buffer[:-1])
+
+    def test_location_too_long_is_rejected(self):
+        with pytest.raises(ValueError):
+            TRANSACTION.encode(Transaction(1.0, self.now, "x" * 33))